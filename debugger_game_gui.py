@@ -1,7 +1,12 @@
 import tkinter as tk
+from abc import ABC, abstractmethod
 from enum import StrEnum
-from random import randint
-from tkinter import ttk, messagebox
+from random import Random
+from time import perf_counter
+from tkinter import ttk
+from typing import Iterable
+
+from game_history import BoardSnapshot, MoveHistory, MoveRecord
 
 
 class ActionType(StrEnum):
@@ -19,6 +24,143 @@ class Cell:
         self.is_set_flag = False # установлен ли флаг в клетку
         self.num_of_bugs_around: int = 0  # кол-во багов вокруг клетки
 
+class CellEvent:
+    """Компактное событие изменения состояния клетки"""
+
+    __slots__ = ("row", "col", "is_revealed", "is_set_flag", "num_of_bugs_around")
+
+    def __init__(self, row: int, col: int, is_revealed: bool, is_set_flag: bool, num_of_bugs_around: int | None) -> None:
+        """
+        :param row: индекс строки клетки
+        :param col: индекс столбца клетки
+        :param is_revealed: открыта ли клетка
+        :param is_set_flag: установлен ли флаг в клетку
+        :param num_of_bugs_around: кол-во багов вокруг (-1 если баг), None если клетка не открыта
+        :return: None
+        """
+        self.row: int = row
+        self.col: int = col
+        self.is_revealed: bool = is_revealed
+        self.is_set_flag: bool = is_set_flag
+        self.num_of_bugs_around: int | None = num_of_bugs_around
+
+    def __repr__(self) -> str:
+        return (
+            f"CellEvent(row={self.row}, col={self.col}, is_revealed={self.is_revealed}, "
+            f"is_set_flag={self.is_set_flag}, num_of_bugs_around={self.num_of_bugs_around})"
+        )
+
+class BoardSubscriber(ABC):
+    """
+    Интерфейс подписчика на изменения игрового поля.
+
+    Придержанные события доставляются заново при следующем ходе игры. Если ходов больше не будет
+    (например, после конца игры), освободившийся подписчик запрашивает доставку сам
+    через BoardEventStream.flush(subscriber).
+    """
+
+    @abstractmethod
+    def on_cell_events(self, events: list[CellEvent]) -> bool:
+        """
+        Принимает пачку событий изменения клеток.
+
+        :param events: список событий изменения клеток
+        :return: истина = события приняты, ложь = подписчик занят и события нужно придержать
+        """
+
+class BoardSubscription:
+    """Класс подписки на поток событий с очередью недоставленных событий"""
+
+    def __init__(self, subscriber: BoardSubscriber, max_batch_size: int | None = None) -> None:
+        """
+        :param subscriber: подписчик
+        :param max_batch_size: максимальный размер одной пачки событий, None = без ограничений
+        :return: None
+        """
+        self.subscriber: BoardSubscriber = subscriber
+        self.max_batch_size: int | None = max_batch_size
+        # Недоставленные события по координатам клетки. Событие несет полное состояние клетки,
+        # поэтому новое событие заменяет старое и очередь не превышает размер поля
+        self.pending: dict[tuple[int, int], CellEvent] = {}
+
+    def deliver(self) -> bool:
+        """
+        Отправляет подписчику накопленные события пачками.
+
+        :return: истина = все события доставлены, ложь = подписчик придержал часть событий
+        """
+        if not self.pending:
+            return True
+
+        events = list(self.pending.values())
+        self.pending = {}
+        batch_size = self.max_batch_size or len(events)
+
+        for start in range(0, len(events), batch_size):
+            # Подписчик занят, возвращаем оставшиеся события в очередь до следующей отправки.
+            # События, пришедшие за время доставки, новее и заменяют старые
+            if not self.subscriber.on_cell_events(events[start:start + batch_size]):
+                remaining = {(event.row, event.col): event for event in events[start:]}
+                remaining.update(self.pending)
+                self.pending = remaining
+                return False
+
+        return not self.pending
+
+class BoardEventStream:
+    """Класс потока событий изменения игрового поля"""
+
+    def __init__(self) -> None:
+        self.subscriptions: list[BoardSubscription] = []
+
+    def subscribe(self, subscriber: BoardSubscriber, max_batch_size: int | None = None) -> None:
+        """
+        Подписывает на события изменения клеток.
+
+        :param subscriber: подписчик
+        :param max_batch_size: максимальный размер одной пачки событий, None = без ограничений
+        :return: None
+        """
+        self.subscriptions.append(BoardSubscription(subscriber, max_batch_size))
+
+    def unsubscribe(self, subscriber: BoardSubscriber) -> None:
+        """
+        Отписывает от событий изменения клеток.
+
+        :param subscriber: подписчик
+        :return: None
+        """
+        self.subscriptions = [
+            subscription for subscription in self.subscriptions if subscription.subscriber is not subscriber
+        ]
+
+    def publish(self, events: list[CellEvent]) -> bool:
+        """
+        Добавляет события в очереди подписчиков и доставляет их вместе с ранее придержанными.
+
+        :param events: список событий изменения клеток
+        :return: истина = у подписчиков не осталось недоставленных событий
+        """
+        is_delivered = True
+        for subscription in self.subscriptions:
+            for event in events:
+                subscription.pending[(event.row, event.col)] = event
+            is_delivered = subscription.deliver() and is_delivered
+        return is_delivered
+
+    def flush(self, subscriber: BoardSubscriber | None = None) -> bool:
+        """
+        Повторно доставляет придержанные события.
+
+        :param subscriber: подписчик, которому нужна доставка, None = всем подписчикам
+        :return: истина = не осталось недоставленных событий
+        """
+        is_delivered = True
+        for subscription in self.subscriptions:
+            if subscriber is None or subscription.subscriber is subscriber:
+                is_delivered = subscription.deliver() and is_delivered
+        return is_delivered
+
 class DebuggerGameResponse:
     """Класс результата игры после клика по клетке"""
 
@@ -36,13 +178,15 @@ class DebuggerGameResponse:
 class DebuggerGame:
     """Класс игры Дебаггер"""
 
-    def __init__(self, rows: int = 10, cols: int = 10, bugs: int = 10) -> None:
+    def __init__(self, rows: int = 10, cols: int = 10, bugs: int = 10, rng: Random | None = None) -> None:
         """
         :param rows: кол-во строк игровых клеток
         :param cols: кол-во столбцов игровых клеток
         :param bugs: кол-во баг
+        :param rng: генератор случайных чисел для расстановки багов, с зерном дает одинаковые поля
         :return: None
         """
+        self.rng: Random = rng if rng is not None else Random()
         self.rows: int = rows
         self.cols: int = cols
         self.bugs: int = bugs if bugs < rows * cols else (rows * cols) // 2
@@ -54,11 +198,121 @@ class DebuggerGame:
         self.is_win: bool = False
         self.is_gameover: bool = False
 
+        self.events: BoardEventStream = BoardEventStream()  # поток событий изменения клеток
+        self.changed_cells: dict[tuple[int, int], tuple[bool, bool]] = {}  # клетки хода и их состояние до хода
+
+        # История ходов для отмены и повтора. Расстановка багов в историю не входит и не откатывается
+        self.history: MoveHistory = MoveHistory(
+            rows=self.rows,
+            get_row_states=self.get_row_states,
+            get_flags=self.get_flags
+        )
+
     @staticmethod
     def get_new_cell() -> Cell:
         """Возвращает инстанс клетки поля"""
         return Cell()
 
+    def mark_changed(self, row: int, col: int) -> None:
+        """
+        Запоминает клетку и ее состояние до изменения за текущий ход.
+        Вызывается перед изменением клетки.
+
+        :param row: индекс строки
+        :param col: индекс столбца
+        :return: None
+        """
+        if (row, col) not in self.changed_cells:
+            self.changed_cells[(row, col)] = self.get_cell_state(row, col)
+
+    def get_cell_state(self, row: int, col: int) -> tuple[bool, bool]:
+        """
+        Возвращает изменяемое ходами состояние клетки.
+
+        :param row: индекс строки
+        :param col: индекс столбца
+        :return: кортеж (открыта ли клетка, установлен ли флаг)
+        """
+        cell = self.board[row][col]
+        return cell.is_revealed, cell.is_set_flag
+
+    def set_cell_state(self, row: int, col: int, state: tuple[bool, bool]) -> None:
+        """
+        Восстанавливает состояние клетки.
+
+        :param row: индекс строки
+        :param col: индекс столбца
+        :param state: кортеж (открыта ли клетка, установлен ли флаг)
+        :return: None
+        """
+        self.mark_changed(row, col)
+        self.board[row][col].is_revealed, self.board[row][col].is_set_flag = state
+
+    def get_row_states(self, row: int) -> tuple[tuple[bool, bool], ...]:
+        """
+        Возвращает состояния клеток строки.
+
+        :param row: индекс строки
+        :return: кортеж состояний клеток
+        """
+        return tuple((cell.is_revealed, cell.is_set_flag) for cell in self.board[row])
+
+    def get_flags(self) -> tuple[bool, bool]:
+        """
+        Возвращает флаги игры.
+
+        :return: кортеж (флаг победы, флаг конца игры)
+        """
+        return self.is_win, self.is_gameover
+
+    def get_cell_event(self, row: int, col: int) -> CellEvent:
+        """
+        Возвращает событие с текущим состоянием клетки.
+
+        :param row: индекс строки
+        :param col: индекс столбца
+        :return: событие изменения клетки
+        """
+        cell = self.board[row][col]
+        return CellEvent(
+            row=row,
+            col=col,
+            is_revealed=cell.is_revealed,
+            is_set_flag=cell.is_set_flag,
+            num_of_bugs_around=cell.num_of_bugs_around if cell.is_revealed else None
+        )
+
+    def finish_move(self, flags_before: tuple[bool, bool], is_recorded: bool = True) -> DebuggerGameResponse:
+        """
+        Записывает ход в историю, публикует события по клеткам, измененным за ход, и возвращает результат хода.
+
+        :param flags_before: флаги игры до хода
+        :param is_recorded: флаг истины записывает ход в историю (ложь для отмены и повтора)
+        :return: модель результата игры после клика по клетке
+        """
+        changes = []
+        for (row, col), state_before in self.changed_cells.items():
+            state_after = self.get_cell_state(row, col)
+            if state_before != state_after:
+                changes.append((row, col, state_before, state_after))
+        self.changed_cells = {}
+
+        flags_after = self.get_flags()
+        if is_recorded and (changes or flags_before != flags_after):
+            self.history.commit(MoveRecord(changes=changes, flags_before=flags_before, flags_after=flags_after))
+        else:
+            # Изменения вне записанных ходов (переход к снимку) тоже должны попасть в следующий снимок
+            self.history.mark_dirty({row for row, _, _, _ in changes})
+
+        # Даже если ход ничего не изменил, повторяем доставку придержанных событий
+        self.events.publish([self.get_cell_event(row, col) for row, col, _, _ in changes])
+
+        return DebuggerGameResponse(
+            is_win=self.is_win,
+            is_gameover=self.is_gameover,
+            board=self.board
+        )
+
     def play_game(self, row: int, col: int, action_type: ActionType) -> DebuggerGameResponse:
         """
         Игровой цикл.
@@ -67,14 +321,12 @@ class DebuggerGame:
         :param action_type: тип действия (открыть клетку или отметить флагом)
         :return: модель результата игры после клика по клетке
         """
+        flags_before = self.get_flags()
+
         # Если игра закончена победой и поражением, то выходим
         if self.is_win or self.is_gameover:
             print("Game Over!")
-            return DebuggerGameResponse(
-                is_win=self.is_win,
-                is_gameover=self.is_gameover,
-                board=self.board
-            )
+            return self.finish_move(flags_before)
 
         # При первом выборе клетки расставляем баги и подсчитываем кол-во багов вокруг клеток
         if self.is_first_click:
@@ -84,20 +336,13 @@ class DebuggerGame:
 
         # Если действие отметить клетку флагом
         if action_type == ActionType.MARK:
+            self.mark_changed(row, col)
             self.board[row][col].is_set_flag = not self.board[row][col].is_set_flag
-            return DebuggerGameResponse(
-                is_win=self.is_win,
-                is_gameover=self.is_gameover,
-                board=self.board
-            )
+            return self.finish_move(flags_before)
 
         # Если действие открыть клетку с флагом, то выходим
         if action_type == ActionType.OPEN and self.board[row][col].is_set_flag:
-            return DebuggerGameResponse(
-                is_win=self.is_win,
-                is_gameover=self.is_gameover,
-                board=self.board
-            )
+            return self.finish_move(flags_before)
 
         # Отобразили клетку и пустые клетки вокруг
         self.reveal(row, col)
@@ -115,11 +360,127 @@ class DebuggerGame:
             self.is_gameover = True
             self.show_all_cells()
 
-        return DebuggerGameResponse(
-            is_win=self.is_win,
-            is_gameover=self.is_gameover,
-            board=self.board
-        )
+        return self.finish_move(flags_before)
+
+    def undo(self) -> DebuggerGameResponse:
+        """
+        Отменяет последний ход. Восстанавливаются только клетки, которые изменил ход.
+
+        :return: модель результата игры после отмены хода
+        """
+        flags_before = self.get_flags()
+        record = self.history.undo()
+        if record is not None:
+            self.undo_record(record)
+
+        return self.finish_move(flags_before, is_recorded=False)
+
+    def redo(self) -> DebuggerGameResponse:
+        """
+        Повторяет последний отмененный ход.
+
+        :return: модель результата игры после повтора хода
+        """
+        flags_before = self.get_flags()
+        record = self.history.redo()
+        if record is not None:
+            self.redo_record(record)
+
+        return self.finish_move(flags_before, is_recorded=False)
+
+    def goto_move(self, move_index: int) -> DebuggerGameResponse:
+        """
+        Переходит к указанному ходу среди сделанных и отмененных ходов.
+        Если от ближайшего периодического снимка до хода ближе, чем от текущего хода,
+        то поле возвращается к снимку и ходы после него повторяются. Иначе ходы отменяются или повторяются по одному.
+
+        :param move_index: номер хода (0 = начало игры)
+        :return: модель результата игры после перехода
+        """
+        flags_before = self.get_flags()
+
+        # Если такого хода нет, то ничего не меняем, как undo и redo без ходов
+        if not 0 <= move_index <= self.history.moves_count:
+            return self.finish_move(flags_before, is_recorded=False)
+
+        distance = abs(self.history.move_index - move_index)
+        checkpoint = self.history.get_checkpoint(move_index)
+
+        if move_index - checkpoint.move_index < distance:
+            seek_result = self.history.seek(move_index)
+            if seek_result is not None:
+                checkpoint, records = seek_result
+                self.apply_snapshot(checkpoint)
+                for record in records:
+                    self.redo_record(record)
+            return self.finish_move(flags_before, is_recorded=False)
+
+        while self.history.move_index > move_index and (record := self.history.undo()) is not None:
+            self.undo_record(record)
+        while self.history.move_index < move_index and (record := self.history.redo()) is not None:
+            self.redo_record(record)
+
+        return self.finish_move(flags_before, is_recorded=False)
+
+    def undo_record(self, record: MoveRecord) -> None:
+        """
+        Возвращает клетки и флаги игры к состоянию до хода.
+
+        :param record: запись хода
+        :return: None
+        """
+        for row, col, state_before, _ in record.changes:
+            self.set_cell_state(row, col, state_before)
+        self.is_win, self.is_gameover = record.flags_before
+
+    def redo_record(self, record: MoveRecord) -> None:
+        """
+        Приводит клетки и флаги игры к состоянию после хода.
+
+        :param record: запись хода
+        :return: None
+        """
+        for row, col, _, state_after in record.changes:
+            self.set_cell_state(row, col, state_after)
+        self.is_win, self.is_gameover = record.flags_after
+
+    def snapshot(self) -> BoardSnapshot:
+        """
+        Делает снимок состояния игры, например, чтобы решатель мог вернуться к нему после перебора ходов.
+
+        :return: снимок поля
+        """
+        return self.history.snapshot()
+
+    def restore(self, snapshot: BoardSnapshot) -> DebuggerGameResponse:
+        """
+        Возвращает игру к снимку. Возврат записывается в историю как обычный ход и его можно отменить.
+
+        :param snapshot: снимок поля
+        :return: модель результата игры после возврата к снимку
+        """
+        flags_before = self.get_flags()
+        self.apply_snapshot(snapshot)
+        return self.finish_move(flags_before)
+
+    def apply_snapshot(self, snapshot: BoardSnapshot) -> None:
+        """
+        Приводит клетки и флаги игры к снимку, меняя только отличающиеся клетки.
+
+        :param snapshot: снимок поля
+        :return: None
+        """
+        current_snapshot = self.history.snapshot()
+
+        for row in range(self.rows):
+            # Общие для снимков строки не менялись, пропускаем их без сравнения клеток
+            if current_snapshot.rows[row] is snapshot.rows[row]:
+                continue
+
+            for col, state in enumerate(snapshot.rows[row]):
+                if state != current_snapshot.rows[row][col]:
+                    self.set_cell_state(row, col, state)
+        self.is_win, self.is_gameover = snapshot.flags
 
     def show_all_cells(self) -> None:
         """
@@ -129,6 +490,9 @@ class DebuggerGame:
         """
         for row in range(self.rows):
             for col in range(self.cols):
+                # Публикуем только клетки, которые действительно изменились
+                if not self.board[row][col].is_revealed or self.board[row][col].is_set_flag:
+                    self.mark_changed(row, col)
                 self.board[row][col].is_revealed = True
                 self.board[row][col].is_set_flag = False
 
@@ -182,19 +546,32 @@ class DebuggerGame:
         :return: None
         """
         # Помечаем клетку открытой
+        self.mark_changed(row, col)
         self.board[row][col].is_revealed = True
 
         # Заполняем поле багами случайным образом
         placed_bugs = 0
         while placed_bugs < self.bugs:
-            random_row = randint(0, self.rows - 1)
-            random_col = randint(0, self.cols - 1)
+            random_row = self.rng.randint(0, self.rows - 1)
+            random_col = self.rng.randint(0, self.cols - 1)
 
             # Ставим баг на клетку если на ней нет бага и она еще не открыта
             if not self.board[random_row][random_col].is_bug and not self.board[random_row][random_col].is_revealed:
                 self.board[random_row][random_col].is_bug = True
                 placed_bugs += 1
 
+    def load_bugs(self, bugs: Iterable[tuple[int, int]]) -> None:
+        """
+        Расставляет баги по заданным клеткам вместо случайной расстановки при первом клике.
+
+        :param bugs: клетки с багами, кортежи (индекс строки, индекс столбца)
+        :return: None
+        """
+        self.is_first_click = False
+        for row, col in bugs:
+            self.board[row][col].is_bug = True
+        self.set_num_of_bugs_around()
+
     def get_neighbors(self, row: int, col: int) -> list[tuple[int, int]]:
         """
         Возвращает список соседних клеток по указанной клетке.
@@ -236,6 +613,8 @@ class DebuggerGame:
             if self.board[_row][_col].is_set_flag:
                 continue
 
+            if not self.board[_row][_col].is_revealed:
+                self.mark_changed(_row, _col)
             self.board[_row][_col].is_revealed = True  # Открываем текущую клетку
 
             # Ищем соседние клетки вокруг текущей клетки и если клетка не имеет вокруг багов
@@ -268,18 +647,82 @@ class CellGUI:
         self.button.bind("<ButtonPress-1>", lambda e, r=self.row, c=self.col, mck=ActionType.OPEN: game_func(e, r, c, mck))
         self.button.bind("<ButtonPress-3>", lambda e, r=self.row, c=self.col, mck=ActionType.MARK: game_func(e, r, c, mck))
 
-class DebuggerGameGUI:
+    def reset(self) -> None:
+        """
+        Приводит клетку к начальному состоянию для повторного использования в новой игре.
+
+        :return: None
+        """
+        self.button.configure(text=" ", state=tk.NORMAL)
+
+    def destroy(self) -> None:
+        """
+        Удаляет кнопку клетки из окна.
+
+        :return: None
+        """
+        self.button.destroy()
+
+class CellGUIPool:
+    """
+    Пул клеток игрового поля.
+
+    Кнопки клеток создаются один раз и переиспользуются между играми.
+    Обработчики нажатий привязаны к координатам клетки, поэтому клетку на той же позиции
+    достаточно сбросить, а не создавать заново. При смене размера поля пул досоздает
+    недостающие клетки и удаляет лишние.
+    """
+
+    def __init__(self, master, game_func):
+        self.master = master
+        self.game_func = game_func
+        self.cells: dict[tuple[int, int], CellGUI] = {}  # клетки пула по координатам (строка, столбец)
+
+    def acquire(self, rows: int, cols: int) -> list[list[CellGUI]]:
+        """
+        Возвращает клетки для поля указанного размера.
+
+        :param rows: кол-во строк игровых клеток
+        :param cols: кол-во столбцов игровых клеток
+        :return: список списков с клетками поля
+        """
+        # Удаляем клетки, которые не помещаются в новое поле
+        for position in [position for position in self.cells if position[0] >= rows or position[1] >= cols]:
+            self.cells.pop(position).destroy()
+
+        board_gui = []
+        for row in range(rows):
+            board_row_gui = []
+            for col in range(cols):
+                cell_gui = self.cells.get((row, col))
+                if cell_gui is None:
+                    # Досоздаем недостающую клетку
+                    cell_gui = CellGUI(self.master, row, col, self.game_func)
+                    self.cells[(row, col)] = cell_gui
+                else:
+                    cell_gui.reset()
+                board_row_gui.append(cell_gui)
+            board_gui.append(board_row_gui)
+
+        return board_gui
+
+class DebuggerGameGUI(BoardSubscriber):
     """Класс графической оболочки и интерфейса взаимодействия игры Дебаггер"""
 
     def __init__(self):
+        # Замер времени до первого кадра начинаем до tk.Tk(): запуск интерпретатора Tk и создание окна -
+        # основная часть времени старта
+        self.started_at: float = perf_counter()
         self.root = tk.Tk()  # создаем главное окно игры
         self.root.title("Дебаггер")
 
         self.debugger_game: DebuggerGame | None = None  # ядро игры
+        self.cells_pool: CellGUIPool = CellGUIPool(self.root, self.play_game)  # пул клеток для переиспользования
         self.board_gui: list[list[CellGUI]] | None = None  # список клеток для отображения в окне
 
         self.mainmenu: tk.Menu | None = None
         self.filemenu: tk.Menu | None = None
+        self.movemenu: tk.Menu | None = None
         self.helpmenu: tk.Menu | None = None
         self.add_menu()
 
@@ -301,10 +744,20 @@ class DebuggerGameGUI:
         self.filemenu.add_command(label="Сложно", command=lambda r=10, c=20, m=40: self.init_game(r, c, m))
         self.filemenu.add_command(label="Выход", command=lambda: self.root.destroy())
 
+        self.movemenu = tk.Menu(self.mainmenu, tearoff=0)
+        self.movemenu.add_command(label="Отменить", accelerator="Ctrl+Z", command=self.undo)
+        self.movemenu.add_command(label="Повторить", accelerator="Ctrl+Y", command=self.redo)
+        # Привязываем и заглавные буквы (Caps Lock), и кириллическую раскладку (Я и Н на тех же клавишах)
+        for keysym in ("z", "Z", "Cyrillic_ya", "Cyrillic_YA"):
+            self.root.bind(f"<Control-{keysym}>", lambda e: self.undo())
+        for keysym in ("y", "Y", "Cyrillic_en", "Cyrillic_EN"):
+            self.root.bind(f"<Control-{keysym}>", lambda e: self.redo())
+
         self.helpmenu = tk.Menu(self.mainmenu, tearoff=0)
         self.helpmenu.add_command(label="О программе", command=self.gui_about)
 
         self.mainmenu.add_cascade(label="Сложность", menu=self.filemenu)
+        self.mainmenu.add_cascade(label="Ход", menu=self.movemenu)
         self.mainmenu.add_cascade(label="Справка", menu=self.helpmenu)
 
     def run(self) -> None:
@@ -313,11 +766,22 @@ class DebuggerGameGUI:
 
         :return: None
         """
+        self.root.after_idle(self.log_first_frame)
         try:
             self.root.mainloop()
         except KeyboardInterrupt:
             pass
 
+    def log_first_frame(self) -> None:
+        """
+        Выводит время от запуска до отрисовки первого кадра.
+
+        :return: None
+        """
+        self.root.update_idletasks()
+        time_to_first_frame = perf_counter() - self.started_at
+        print(f"{time_to_first_frame=:.3f}s")
+
     def play_game(self, event, row: int, col: int, action_type: ActionType) -> None:
         """
         Функция, которая вызывается при клике по игровой клетке.
@@ -332,9 +796,33 @@ class DebuggerGameGUI:
         if str(self.board_gui[row][col].button['state']) == tk.DISABLED:
             return
 
-        # Обращаемся к ядру игры за результатом
+        # Обращаемся к ядру игры за результатом, измененные клетки придут в on_cell_events
         debugger_game_response = self.debugger_game.play_game(row=row, col=col, action_type=action_type)
+        self.show_game_result(debugger_game_response)
+
+    def undo(self) -> None:
+        """
+        Отменяет последний ход.
+
+        :return: None
+        """
+        self.show_game_result(self.debugger_game.undo())
+
+    def redo(self) -> None:
+        """
+        Повторяет последний отмененный ход.
 
+        :return: None
+        """
+        self.show_game_result(self.debugger_game.redo())
+
+    def show_game_result(self, debugger_game_response: DebuggerGameResponse) -> None:
+        """
+        Отображает текст с результатом игры.
+
+        :param debugger_game_response: модель результата игры после клика по клетке
+        :return: None
+        """
         # Отображаем текст, если выиграли или проиграли
         if debugger_game_response.is_win:
             print(f"{debugger_game_response.is_win=}")
@@ -344,38 +832,43 @@ class DebuggerGameGUI:
             print(f"{debugger_game_response.is_gameover=}")
             self.info_button.configure(text="Поражение! Баг сломал код!")
 
-        # Обновляем отображение игрового поля
-        self.update_gui(debugger_game_response)
+        else:
+            self.info_button.configure(text="Отметьте все баги")
 
-    def update_gui(self, debugger_game_response: DebuggerGameResponse) -> None:
+    def on_cell_events(self, events: list[CellEvent]) -> bool:
         """
-        Функция визуального обновления игрового поля после клика.
+        Визуально обновляет только изменившиеся клетки игрового поля.
 
-        :param debugger_game_response: модель результата игры после клика по клетке
-        :return: None
+        :param events: список событий изменения клеток
+        :return: истина = события приняты
         """
-        for board_row_gui in self.board_gui:
-            for board_cell_gui in board_row_gui:
-                debugger_game_cell = debugger_game_response.board[board_cell_gui.row][board_cell_gui.col]
-                if debugger_game_cell.is_set_flag:
-                    text = "?"
-                    board_cell_gui.button.configure(text=text)
-                    continue
+        for event in events:
+            button = self.board_gui[event.row][event.col].button
 
-                if debugger_game_cell.is_revealed:
-                    if debugger_game_cell.is_bug:
-                        text = "Б"
-                    elif debugger_game_cell.num_of_bugs_around != 0:
-                        text = str(debugger_game_cell.num_of_bugs_around)
-                    else:
-                        text = " "  # Если пустая ячейка
+            # Закрытая клетка, с флагом или без, должна принимать клики,
+            # даже если ее выключили в конце игры, а потом ход отменили
+            if not event.is_revealed:
+                button.configure(state=tk.NORMAL)
 
-                    board_cell_gui.button.configure(state=tk.DISABLED)
-                    board_cell_gui.button.configure(text=text)
-                    continue
+            if event.is_set_flag:
+                button.configure(text="?")
+                continue
 
-                text = " "  # Если пустая ячейка
-                board_cell_gui.button.configure(text=text)
+            if event.is_revealed:
+                if event.num_of_bugs_around == -1:
+                    text = "Б"
+                elif event.num_of_bugs_around != 0:
+                    text = str(event.num_of_bugs_around)
+                else:
+                    text = " "  # Если пустая ячейка
+
+                button.configure(state=tk.DISABLED)
+                button.configure(text=text)
+                continue
+
+            button.configure(text=" ")  # Если пустая ячейка
+
+        return True
 
     @staticmethod
     def gui_about() -> None:
@@ -384,11 +877,15 @@ class DebuggerGameGUI:
 
         :return: None
         """
+        # Модуль окон сообщений нужен только для справки, поэтому не загружаем его при старте
+        from tkinter import messagebox
+
         messagebox.showinfo(
             title="О программе",
             message="Игра Дебаггер - нужно отметить все баги в коде.\n\n"
             "Для отметки бага нажмите правую клавишу мыши.\n"
-            "Для открытия клетки нажмите левую клавишу мыши.\n\n"
+            "Для открытия клетки нажмите левую клавишу мыши.\n"
+            "Для отмены хода нажмите Ctrl+Z, для повтора Ctrl+Y.\n\n"
             "Число показывает количество багов вокруг клетки.\n\n"
             "Если отметить все баги, то игра завершится победой.\n"
             "При попадании на баг игра завершится проигрышем.\n"
@@ -403,35 +900,15 @@ class DebuggerGameGUI:
         :param bugs: кол-во багов
         :return: None
         """
-        self.uninit_game()  # Сначала все чистим от старых клеток
-
         self.debugger_game = DebuggerGame(rows, cols, bugs)  # Создаем ядро игры
-        self.board_gui: list[list[CellGUI]] = [
-            [CellGUI(self.root, row, col, self.play_game) for col in range(cols)] for row in range(rows)
-        ] # Создаем графическое отображение клеток
-
-        # Добавляем кнопку для отображения текстовой информации
-        self.info_button = ttk.Button(self.root, text="Отметьте все баги", state=tk.DISABLED, width=3 * cols)
-        self.info_button.grid(row=rows + 1, columnspan=cols)
-
-    def uninit_game(self) -> None:
-        """
-        Метод приведения игры к начальному состоянию
-
-        :return: None
-        """
-        # Удаляем кнопки игровых клеток
-        if self.board_gui is not None:
-            for row in self.board_gui:
-                for col in row:
-                    col.button.destroy()
-            self.board_gui = None
-
-        # Удаляем кнопку для отображения текстовой информации
-        if self.info_button is not None:
-            self.info_button.destroy()
-            self.info_button = None
-
+        self.debugger_game.events.subscribe(self)  # Подписываемся на изменения клеток
+        self.board_gui = self.cells_pool.acquire(rows, cols)  # Берем клетки из пула
+
+        # Добавляем кнопку для отображения текстовой информации или переиспользуем существующую
+        if self.info_button is None:
+            self.info_button = ttk.Button(self.root, state=tk.DISABLED)
+        self.info_button.configure(text="Отметьте все баги", width=3 * cols)
+        self.info_button.grid(row=rows + 1, column=0, columnspan=cols)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,209 @@
+from typing import Callable, Hashable
+
+
+class MoveRecord:
+    """Класс записи одного хода: только клетки, которые изменил ход"""
+
+    __slots__ = ("changes", "flags_before", "flags_after")
+
+    def __init__(
+            self,
+            changes: list[tuple[int, int, Hashable, Hashable]],
+            flags_before: tuple,
+            flags_after: tuple
+    ) -> None:
+        """
+        :param changes: список из кортежей (индекс строки, индекс столбца, состояние до хода, состояние после хода)
+        :param flags_before: флаги игры до хода
+        :param flags_after: флаги игры после хода
+        :return: None
+        """
+        self.changes: list[tuple[int, int, Hashable, Hashable]] = changes
+        self.flags_before: tuple = flags_before
+        self.flags_after: tuple = flags_after
+
+    def get_rows(self) -> set[int]:
+        """
+        Возвращает индексы строк, в которых ход изменил клетки.
+
+        :return: множество индексов строк
+        """
+        return {row for row, _, _, _ in self.changes}
+
+class BoardSnapshot:
+    """
+    Класс снимка состояния игрового поля.
+
+    Снимок хранит неизменяемые кортежи строк. Строки, которые не менялись с прошлого снимка,
+    не копируются, а переиспользуются из него (копирование при записи).
+    """
+
+    __slots__ = ("rows", "flags", "move_index")
+
+    def __init__(self, rows: tuple[tuple[Hashable, ...], ...], flags: tuple, move_index: int) -> None:
+        """
+        :param rows: кортеж строк с состояниями клеток
+        :param flags: флаги игры
+        :param move_index: кол-во сделанных ходов на момент снимка
+        :return: None
+        """
+        self.rows: tuple[tuple[Hashable, ...], ...] = rows
+        self.flags: tuple = flags
+        self.move_index: int = move_index
+
+class MoveHistory:
+    """Класс истории ходов для отмены и повтора"""
+
+    def __init__(
+            self,
+            rows: int,
+            get_row_states: Callable[[int], tuple[Hashable, ...]],
+            get_flags: Callable[[], tuple],
+            snapshot_interval: int = 32
+    ) -> None:
+        """
+        :param rows: кол-во строк игрового поля
+        :param get_row_states: функция, возвращающая состояния клеток строки по ее индексу
+        :param get_flags: функция, возвращающая флаги игры
+        :param snapshot_interval: через сколько ходов делать снимок поля
+        :return: None
+        """
+        self.rows: int = rows
+        self.get_row_states: Callable[[int], tuple[Hashable, ...]] = get_row_states
+        self.get_flags: Callable[[], tuple] = get_flags
+        self.snapshot_interval: int = snapshot_interval
+
+        self.records: list[MoveRecord] = []  # сделанные ходы, последний ход в конце
+        self.redo_records: list[MoveRecord] = []  # отмененные ходы, последний отмененный в конце
+
+        self.last_snapshot: BoardSnapshot | None = None  # последний снимок для переиспользования строк
+        self.dirty_rows: set[int] = set()  # строки, изменившиеся с последнего снимка
+
+        # Периодические снимки поля: точки, от которых быстро перейти к любому ходу через seek.
+        # Снимок начального поля есть всегда
+        self.snapshots: list[BoardSnapshot] = [self.snapshot()]
+
+    @property
+    def move_index(self) -> int:
+        """Кол-во сделанных ходов"""
+        return len(self.records)
+
+    @property
+    def moves_count(self) -> int:
+        """Кол-во сделанных и отмененных ходов, к которым можно перейти"""
+        return len(self.records) + len(self.redo_records)
+
+    def commit(self, record: MoveRecord) -> None:
+        """
+        Добавляет ход в историю. Отмененные ходы после этого повторить уже нельзя.
+
+        :param record: запись хода
+        :return: None
+        """
+        self.records.append(record)
+        self.redo_records.clear()
+        self.dirty_rows |= record.get_rows()
+
+        # Снимки из отмененной ветки ходов больше не нужны
+        self.prune_snapshots(len(self.records) - 1)
+
+        if len(self.records) % self.snapshot_interval == 0:
+            self.snapshots.append(self.snapshot())
+
+    def undo(self) -> MoveRecord | None:
+        """
+        Забирает последний ход для отмены.
+
+        :return: запись хода или None, если отменять нечего
+        """
+        if not self.records:
+            return None
+
+        record = self.records.pop()
+        self.redo_records.append(record)
+        self.dirty_rows |= record.get_rows()
+        self.prune_snapshots(len(self.records))
+        return record
+
+    def redo(self) -> MoveRecord | None:
+        """
+        Забирает последний отмененный ход для повтора.
+
+        :return: запись хода или None, если повторять нечего
+        """
+        if not self.redo_records:
+            return None
+
+        record = self.redo_records.pop()
+        self.records.append(record)
+        self.dirty_rows |= record.get_rows()
+        return record
+
+    def get_checkpoint(self, move_index: int) -> BoardSnapshot | None:
+        """
+        Возвращает ближайший периодический снимок не позже указанного хода.
+
+        :param move_index: номер хода
+        :return: снимок поля или None, если номер хода отрицательный
+        """
+        return next(
+            (snapshot for snapshot in reversed(self.snapshots) if snapshot.move_index <= move_index),
+            None
+        )
+
+    def seek(self, move_index: int) -> tuple[BoardSnapshot, list[MoveRecord]] | None:
+        """
+        Переходит к указанному ходу среди сделанных и отмененных ходов.
+        Поле нужно вернуть к ближайшему снимку и повторить после него возвращенные ходы.
+
+        :param move_index: номер хода
+        :return: кортеж (снимок поля, ходы для повтора) или None, если такого хода нет
+        """
+        if not 0 <= move_index <= self.moves_count:
+            return None
+
+        line = self.records + self.redo_records[::-1]
+
+        checkpoint = self.get_checkpoint(move_index)
+        self.records = line[:move_index]
+        self.redo_records = line[move_index:][::-1]
+        self.prune_snapshots(move_index)
+        return checkpoint, line[checkpoint.move_index:move_index]
+
+    def prune_snapshots(self, move_index: int) -> None:
+        """
+        Удаляет периодические снимки, сделанные после указанного хода.
+
+        :param move_index: номер хода
+        :return: None
+        """
+        while self.snapshots[-1].move_index > move_index:
+            self.snapshots.pop()
+
+    def mark_dirty(self, rows: set[int]) -> None:
+        """
+        Помечает строки, изменившиеся вне записанных ходов, например при переходе к снимку.
+
+        :param rows: множество индексов строк
+        :return: None
+        """
+        self.dirty_rows |= rows
+
+    def snapshot(self) -> BoardSnapshot:
+        """
+        Делает снимок текущего состояния поля.
+        Заново собираются только строки, изменившиеся с прошлого снимка.
+
+        :return: снимок поля
+        """
+        if self.last_snapshot is None:
+            rows = tuple(self.get_row_states(row) for row in range(self.rows))
+        else:
+            rows = tuple(
+                self.get_row_states(row) if row in self.dirty_rows else self.last_snapshot.rows[row]
+                for row in range(self.rows)
+            )
+
+        self.last_snapshot = BoardSnapshot(rows=rows, flags=self.get_flags(), move_index=len(self.records))
+        self.dirty_rows = set()
+        return self.last_snapshot
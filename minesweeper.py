@@ -1,5 +1,7 @@
 from random import randint
 
+from game_history import MoveHistory, MoveRecord
+
 
 class Cell:
     """Класс одной клетки поля"""
@@ -124,6 +126,15 @@ class Minesweeper:
         self.board: list[list[Cell]] = [[self.get_new_cell() for _ in range(cols)] for _ in range(rows)]
         self.max_col_simbls: int = len(str(self.cols - 1))  # Максимальная длина цифры столбца
 
+        self.changed_cells: dict[tuple[int, int], bool] = {}  # клетки хода и их состояние до хода
+
+        # История ходов для отмены и повтора. Расстановка мин в историю не входит и не откатывается
+        self.history: MoveHistory = MoveHistory(
+            rows=self.rows,
+            get_row_states=self.get_row_states,
+            get_flags=lambda: ()
+        )
+
         # Класс для отображения игрового поля
         self.draw_board = DrawBoard(
             rows=self.rows,
@@ -136,6 +147,71 @@ class Minesweeper:
         """Возвращает инстанс клетки поля"""
         return Cell()
 
+    def mark_changed(self, row: int, col: int) -> None:
+        """
+        Запоминает клетку и ее состояние до изменения за текущий ход.
+        Вызывается перед изменением клетки.
+
+        :param row: индекс строки
+        :param col: индекс столбца
+        :return: None
+        """
+        if (row, col) not in self.changed_cells:
+            self.changed_cells[(row, col)] = self.board[row][col].is_revealed
+
+    def get_row_states(self, row: int) -> tuple[bool, ...]:
+        """
+        Возвращает состояния клеток строки.
+
+        :param row: индекс строки
+        :return: кортеж из флагов открытия клеток
+        """
+        return tuple(cell.is_revealed for cell in self.board[row])
+
+    def finish_move(self) -> None:
+        """
+        Записывает в историю клетки, измененные за ход.
+
+        :return: None
+        """
+        changes = [
+            (row, col, state_before, self.board[row][col].is_revealed)
+            for (row, col), state_before in self.changed_cells.items()
+            if state_before != self.board[row][col].is_revealed
+        ]
+        self.changed_cells = {}
+
+        if changes:
+            self.history.commit(MoveRecord(changes=changes, flags_before=(), flags_after=()))
+
+    def undo(self) -> bool:
+        """
+        Отменяет последний ход. Восстанавливаются только клетки, которые изменил ход.
+
+        :return: истина = ход отменен, ложь = отменять нечего
+        """
+        record = self.history.undo()
+        if record is None:
+            return False
+
+        for row, col, state_before, _ in record.changes:
+            self.board[row][col].is_revealed = state_before
+        return True
+
+    def redo(self) -> bool:
+        """
+        Повторяет последний отмененный ход.
+
+        :return: истина = ход повторен, ложь = повторять нечего
+        """
+        record = self.history.redo()
+        if record is None:
+            return False
+
+        for row, col, _, state_after in record.changes:
+            self.board[row][col].is_revealed = state_after
+        return True
+
     def play(self) -> None:
         """
         Игровой цикл.
@@ -146,9 +222,19 @@ class Minesweeper:
             # Отображаем игровое поле
             self.draw_board.print_board(board=self.board)
 
-            # Просим игрока выбрать клетку
+            # Просим игрока выбрать клетку или отменить/повторить ход
+            command = input("Enter row and column (u - undo, r - redo): ").strip().lower()
+            if command == "u":
+                if not self.undo():
+                    print("Nothing to undo.")
+                continue
+            if command == "r":
+                if not self.redo():
+                    print("Nothing to redo.")
+                continue
+
             try:
-                row, col = map(int, input("Enter row and column: ").split())
+                row, col = map(int, command.split())
                 assert 0 <= row < self.rows and 0 <= col < self.cols
             except (ValueError, AssertionError):
                 print(f"Invalid input. Please enter numbers between {self.rows - 1} and {self.cols - 1}.")
@@ -168,6 +254,7 @@ class Minesweeper:
 
             # Отобразили клетку и пустые клетки вокруг
             self.reveal(row, col)
+            self.finish_move()
 
             # Проверили условие победы
             if self.is_win():
@@ -225,6 +312,7 @@ class Minesweeper:
         :return: None
         """
         # Помечаем клетку открытой
+        self.mark_changed(row, col)
         self.board[row][col].is_revealed = True
 
         # Заполняем поле минами случайным образом
@@ -274,6 +362,7 @@ class Minesweeper:
         while stack:
             current_cell = stack.pop()  # Берем последнюю клетку из стэка
             _row, _col = current_cell
+            self.mark_changed(_row, _col)
             self.board[_row][_col].is_revealed = True  # Открываем текущую клетку
 
             # Ищем соседние клетки вокруг текущей клетки или если клетка не имеет вокруг мин
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Модули игры лежат в корне репозитория и запускаются как скрипты, а не как пакет
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,93 @@
+from random import Random
+
+import pytest
+
+from debugger_game_gui import ActionType, BoardSubscriber, CellEvent, DebuggerGame
+
+
+class RecordingSubscriber(BoardSubscriber):
+    """Подписчик, который запоминает пачки событий и может притвориться занятым"""
+
+    def __init__(self) -> None:
+        self.is_busy: bool = False
+        self.batches: list[list[CellEvent]] = []
+
+    def on_cell_events(self, events: list[CellEvent]) -> bool:
+        if self.is_busy:
+            return False
+        self.batches.append(events)
+        return True
+
+    @property
+    def cells(self) -> set[tuple[int, int]]:
+        return {(event.row, event.col) for batch in self.batches for event in batch}
+
+
+def make_game() -> DebuggerGame:
+    return DebuggerGame(8, 8, 10, rng=Random(0))
+
+
+def find_bug(game: DebuggerGame) -> tuple[int, int]:
+    return next((row, col) for row in range(8) for col in range(8) if game.board[row][col].is_bug)
+
+
+def test_subscriber_without_handler_fails_on_creation():
+    class BrokenSubscriber(BoardSubscriber):
+        pass
+
+    with pytest.raises(TypeError):
+        BrokenSubscriber()
+
+
+def test_events_cover_only_changed_cells():
+    game = make_game()
+    subscriber = RecordingSubscriber()
+    game.events.subscribe(subscriber)
+
+    game.play_game(0, 0, ActionType.OPEN)
+
+    revealed = {(row, col) for row in range(8) for col in range(8) if game.board[row][col].is_revealed}
+    assert len(subscriber.batches) == 1
+    assert subscriber.cells == revealed
+
+
+def test_batches_respect_max_batch_size():
+    game = make_game()
+    subscriber = RecordingSubscriber()
+    game.events.subscribe(subscriber, max_batch_size=3)
+
+    game.play_game(0, 0, ActionType.OPEN)
+
+    assert all(len(batch) <= 3 for batch in subscriber.batches)
+    assert len(subscriber.cells) == sum(len(batch) for batch in subscriber.batches)
+
+
+def test_held_events_are_redelivered_on_next_move():
+    game = make_game()
+    subscriber = RecordingSubscriber()
+    game.events.subscribe(subscriber)
+
+    subscriber.is_busy = True
+    game.play_game(0, 0, ActionType.OPEN)
+    assert not subscriber.batches
+
+    subscriber.is_busy = False
+    bug = find_bug(game)
+    game.play_game(*bug, ActionType.MARK)
+    assert bug in subscriber.cells
+    assert (0, 0) in subscriber.cells
+
+
+def test_held_events_after_game_over_are_delivered_on_request():
+    game = make_game()
+    subscriber = RecordingSubscriber()
+    game.events.subscribe(subscriber)
+    game.play_game(0, 0, ActionType.OPEN)
+
+    subscriber.is_busy = True
+    game.play_game(*find_bug(game), ActionType.OPEN)
+    assert game.is_gameover
+
+    subscriber.is_busy = False
+    assert game.events.flush(subscriber)
+    assert subscriber.cells == {(row, col) for row in range(8) for col in range(8)}
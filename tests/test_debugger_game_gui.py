@@ -0,0 +1,70 @@
+from random import Random
+
+import tkinter as tk
+
+from debugger_game_gui import ActionType, DebuggerGame, DebuggerGameGUI
+
+
+class StubButton:
+    """Кнопка без окна: хранит только параметры, которые задает интерфейс"""
+
+    def __init__(self) -> None:
+        self.options: dict = {"state": tk.NORMAL, "text": " "}
+
+    def configure(self, **options) -> None:
+        self.options.update(options)
+
+    def __getitem__(self, key: str):
+        return self.options[key]
+
+
+class StubCellGUI:
+    def __init__(self) -> None:
+        self.button: StubButton = StubButton()
+
+
+def make_gui(game: DebuggerGame) -> DebuggerGameGUI:
+    """Создает интерфейс без окна Tk с заглушками вместо кнопок"""
+    gui = DebuggerGameGUI.__new__(DebuggerGameGUI)
+    gui.debugger_game = game
+    gui.board_gui = [[StubCellGUI() for _ in range(game.cols)] for _ in range(game.rows)]
+    gui.info_button = StubButton()
+    game.events.subscribe(gui)
+    return gui
+
+
+def find_cells(game: DebuggerGame, is_bug: bool) -> list[tuple[int, int]]:
+    return [
+        (row, col) for row in range(game.rows) for col in range(game.cols)
+        if game.board[row][col].is_bug == is_bug and not game.board[row][col].is_revealed
+    ]
+
+
+def test_undo_game_over_enables_closed_cells():
+    game = DebuggerGame(8, 8, 10, rng=Random(0))
+    gui = make_gui(game)
+    gui.play_game(None, 0, 0, ActionType.OPEN)
+
+    flagged_bug, opened_bug = find_cells(game, is_bug=True)[:2]
+    flagged_cell = find_cells(game, is_bug=False)[0]
+    gui.play_game(None, *flagged_bug, ActionType.MARK)
+    gui.play_game(None, *flagged_cell, ActionType.MARK)
+    gui.play_game(None, *opened_bug, ActionType.OPEN)
+    assert game.is_gameover
+    assert all(cell.button["state"] == tk.DISABLED for row in gui.board_gui for cell in row)
+
+    gui.undo()
+
+    assert not game.is_gameover
+    assert gui.info_button["text"] == "Отметьте все баги"
+    for row in range(game.rows):
+        for col in range(game.cols):
+            button = gui.board_gui[row][col].button
+            assert button["state"] == (tk.DISABLED if game.board[row][col].is_revealed else tk.NORMAL)
+    assert gui.board_gui[flagged_bug[0]][flagged_bug[1]].button["text"] == "?"
+    assert gui.board_gui[flagged_cell[0]][flagged_cell[1]].button["text"] == "?"
+
+    # Ошибочный флаг можно снять, а клетку открыть
+    gui.play_game(None, *flagged_cell, ActionType.MARK)
+    gui.play_game(None, *flagged_cell, ActionType.OPEN)
+    assert game.board[flagged_cell[0]][flagged_cell[1]].is_revealed
@@ -0,0 +1,184 @@
+from random import Random
+
+import pytest
+
+from debugger_game_gui import ActionType, BoardSubscriber, CellEvent, DebuggerGame
+from minesweeper import Minesweeper
+
+
+def get_state(game: DebuggerGame) -> tuple:
+    """Возвращает полное изменяемое ходами состояние игры"""
+    return tuple(game.get_row_states(row) for row in range(game.rows)) + (game.get_flags(),)
+
+
+def play_random_moves(game: DebuggerGame, rng: Random, moves: int) -> list[tuple]:
+    """
+    Делает случайные ходы до конца игры и возвращает состояния после каждого записанного хода.
+    Баги открываются редко, чтобы история получалась длинной.
+    """
+    states = [get_state(game)]
+    for _ in range(moves):
+        if game.is_gameover:
+            break
+
+        hidden_cells = [
+            (row, col) for row in range(game.rows) for col in range(game.cols)
+            if not game.board[row][col].is_revealed
+        ]
+        action_type = ActionType.MARK if rng.random() < 0.3 else ActionType.OPEN
+        if action_type == ActionType.OPEN and rng.random() < 0.95:
+            hidden_cells = [(row, col) for row, col in hidden_cells if not game.board[row][col].is_bug]
+        row, col = rng.choice(hidden_cells)
+
+        move_index = game.history.move_index
+        game.play_game(row, col, action_type)
+        if game.history.move_index != move_index:
+            states.append(get_state(game))
+    return states
+
+
+@pytest.fixture
+def game() -> DebuggerGame:
+    game = DebuggerGame(12, 12, 30, rng=Random(1))
+    game.history.snapshot_interval = 3
+    return game
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_undo_all_returns_fresh_board(seed):
+    game = DebuggerGame(12, 12, 30, rng=Random(seed))
+    game.history.snapshot_interval = 3
+    play_random_moves(game, Random(seed), moves=40)
+
+    while game.history.move_index:
+        game.undo()
+
+    assert get_state(game) == get_state(DebuggerGame(12, 12, 30))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_redo_after_undo_replays_every_move(seed):
+    game = DebuggerGame(12, 12, 30, rng=Random(seed))
+    game.history.snapshot_interval = 3
+    states = play_random_moves(game, Random(seed), moves=40)
+
+    for move_index in range(len(states) - 1, 0, -1):
+        game.undo()
+        assert get_state(game) == states[move_index - 1]
+
+    for move_index in range(1, len(states)):
+        game.redo()
+        assert get_state(game) == states[move_index]
+
+
+def test_undo_and_redo_without_history_change_nothing(game):
+    state = get_state(game)
+    game.undo()
+    game.redo()
+    assert get_state(game) == state
+
+
+def test_new_move_after_undo_drops_redo(game):
+    play_random_moves(game, Random(2), moves=5)
+    game.undo()
+    play_random_moves(game, Random(3), moves=1)
+
+    state = get_state(game)
+    game.redo()
+    assert get_state(game) == state
+
+
+def test_restore_after_interleaved_snapshots(game):
+    rng = Random(4)
+    play_random_moves(game, rng, moves=2)
+
+    snapshots = []
+    for _ in range(4):
+        snapshots.append((game.snapshot(), get_state(game)))
+        play_random_moves(game, rng, moves=4)
+        game.snapshot()  # промежуточный снимок переиспользует часть строк предыдущего
+
+    assert len(game.history.snapshots) > 1  # периодические снимки тоже были сделаны
+
+    for snapshot, state in reversed(snapshots):
+        game.restore(snapshot)
+        assert get_state(game) == state
+
+    # Возврат к снимку записан как ход и отменяется
+    game.undo()
+    assert get_state(game) == snapshots[1][1]
+
+
+def test_restore_publishes_changed_cells(game):
+    rng = Random(5)
+    play_random_moves(game, rng, moves=1)
+    snapshot = game.snapshot()
+    play_random_moves(game, rng, moves=6)
+    state_before = get_state(game)
+
+    class Recorder(BoardSubscriber):
+        def __init__(self) -> None:
+            self.cells: set[tuple[int, int]] = set()
+
+        def on_cell_events(self, events: list[CellEvent]) -> bool:
+            self.cells |= {(event.row, event.col) for event in events}
+            return True
+
+    recorder = Recorder()
+    game.events.subscribe(recorder)
+    game.restore(snapshot)
+
+    assert recorder.cells == {
+        (row, col) for row in range(game.rows) for col in range(game.cols)
+        if state_before[row][col] != snapshot.rows[row][col]
+    }
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_goto_move_matches_recorded_states(seed):
+    game = DebuggerGame(12, 12, 30, rng=Random(seed))
+    game.history.snapshot_interval = 3
+    states = play_random_moves(game, Random(seed), moves=40)
+
+    rng = Random(seed)
+    for _ in range(20):
+        move_index = rng.randrange(len(states))
+        game.goto_move(move_index)
+        assert game.history.move_index == move_index
+        assert get_state(game) == states[move_index]
+
+
+def test_undo_prunes_periodic_snapshots(game):
+    play_random_moves(game, Random(6), moves=40)
+    while game.history.move_index:
+        game.undo()
+        assert all(snapshot.move_index <= game.history.move_index for snapshot in game.history.snapshots)
+
+
+def test_minesweeper_undo_and_redo():
+    game = Minesweeper(6, 6, 4)
+    game.place_mines(0, 0)
+    game.set_num_of_mines_around()
+    game.reveal(0, 0)
+    game.finish_move()
+    revealed = game.get_row_states(0)
+
+    assert game.undo()
+    assert all(not cell.is_revealed for row in game.board for cell in row)
+    assert game.redo()
+    assert game.get_row_states(0) == revealed
+    assert not game.redo()
+
+
+def test_goto_move_out_of_range_changes_nothing(game):
+    play_random_moves(game, Random(7), moves=10)
+    game.undo()
+    state = get_state(game)
+    move_index = game.history.move_index
+
+    for out_of_range in (-1, game.history.moves_count + 1):
+        game.goto_move(out_of_range)
+        assert game.history.move_index == move_index
+        assert get_state(game) == state
+
+    assert game.history.get_checkpoint(-1) is None
@@ -0,0 +1,66 @@
+from debugger_game_gui import DebuggerGame
+from tournament import STRATEGIES, BoardCorpus, StrategyReport, play_board, run_tournament, single_point_strategy
+
+
+def test_corpus_is_reproducible_and_cached(tmp_path):
+    corpus = BoardCorpus(8, 8, 10, games=20, seed=3).load(tmp_path)
+    cached = BoardCorpus(8, 8, 10, games=20, seed=3).load(tmp_path)
+
+    assert len(list(tmp_path.iterdir())) == 1
+    assert [(board.first_click, board.bugs) for board in cached.boards] == [
+        (board.first_click, board.bugs) for board in corpus.boards
+    ]
+    assert all(len(board.bugs) == 10 and board.first_click not in board.bugs for board in corpus.boards)
+
+
+def test_broken_cache_is_regenerated(tmp_path):
+    corpus = BoardCorpus(8, 8, 10, games=20, seed=3).load(tmp_path)
+    path = next(tmp_path.iterdir())
+    data = path.read_bytes()
+
+    for broken_data in (data[:len(data) // 2], b"not a corpus"):
+        path.write_bytes(broken_data)
+        reloaded = BoardCorpus(8, 8, 10, games=20, seed=3).load(tmp_path)
+        assert [board.bugs for board in reloaded.boards] == [board.bugs for board in corpus.boards]
+        assert path.read_bytes() == data
+
+
+def test_load_bugs_sets_fixed_layout():
+    game = DebuggerGame(3, 3, 1)
+    game.load_bugs([(1, 1)])
+
+    assert not game.is_first_click
+    assert game.board[1][1].is_bug
+    assert all(
+        game.board[row][col].num_of_bugs_around == 1
+        for row in range(3) for col in range(3) if (row, col) != (1, 1)
+    )
+
+
+def test_play_board_counts_game(tmp_path):
+    corpus = BoardCorpus(8, 8, 5, games=3, seed=1).load(tmp_path)
+    report = StrategyReport("single_point")
+    for index, board in enumerate(corpus.boards):
+        play_board(single_point_strategy, corpus, board, seed=index, report=report)
+
+    assert report.games == 3
+    assert report.decisions > 0
+    assert 0 < report.decision_time
+    assert report.guesses <= report.decisions
+
+
+def test_run_tournament_merges_chunks_and_is_reproducible(tmp_path):
+    corpus = BoardCorpus(8, 8, 10, games=10, seed=2).load(tmp_path)
+
+    reports = run_tournament(corpus, workers=1, chunk_size=4)
+    rerun_reports = run_tournament(corpus, workers=1, chunk_size=4)
+    single_chunk_reports = run_tournament(corpus, workers=1, chunk_size=len(corpus.boards))
+
+    assert [report.name for report in reports] == list(STRATEGIES)
+    assert all(report.games == len(corpus.boards) for report in reports)
+    assert all(report.decisions > 0 for report in reports)
+    assert [(report.wins, report.guesses, report.decisions) for report in reports] == [
+        (report.wins, report.guesses, report.decisions) for report in rerun_reports
+    ] == [
+        (report.wins, report.guesses, report.decisions) for report in single_chunk_reports
+    ]
@@ -0,0 +1,480 @@
+import argparse
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from random import Random
+from struct import Struct
+from tempfile import NamedTemporaryFile
+from time import perf_counter
+from typing import Callable
+
+from debugger_game_gui import ActionType, BoardSubscriber, CellEvent, DebuggerGame
+
+HIDDEN = -2  # закрытая клетка на поле игрока
+FLAG = -3  # клетка с флагом на поле игрока
+
+CORPUS_VERSION = 1  # версия формата файла корпуса, входит в ключ кэша
+CORPUS_CACHE_DIR = Path(__file__).resolve().parent / ".corpus_cache"
+FIRST_CLICK = Struct("<HH")  # заголовок поля в файле корпуса: строка и столбец первого клика
+
+
+class CorpusBoard:
+    """Класс одного поля корпуса: первый клик и расстановка багов"""
+
+    __slots__ = ("first_click", "bugs")
+
+    def __init__(self, first_click: tuple[int, int], bugs: frozenset[tuple[int, int]]) -> None:
+        """
+        :param first_click: кортеж (индекс строки, индекс столбца) первого клика
+        :param bugs: множество клеток с багами
+        :return: None
+        """
+        self.first_click: tuple[int, int] = first_click
+        self.bugs: frozenset[tuple[int, int]] = bugs
+
+class BoardCorpus:
+    """Класс корпуса одинаковых для всех стратегий полей"""
+
+    def __init__(self, rows: int, cols: int, bugs: int, games: int, seed: int = 0) -> None:
+        """
+        :param rows: кол-во строк игровых клеток
+        :param cols: кол-во столбцов игровых клеток
+        :param bugs: кол-во багов
+        :param games: кол-во полей в корпусе
+        :param seed: зерно генератора полей
+        :return: None
+        """
+        self.rows: int = rows
+        self.cols: int = cols
+        self.bugs: int = bugs
+        self.games: int = games
+        self.seed: int = seed
+        self.boards: list[CorpusBoard] = []
+
+    @property
+    def cache_key(self) -> str:
+        """Ключ кэша по параметрам корпуса"""
+        return f"v{CORPUS_VERSION}_{self.rows}x{self.cols}_b{self.bugs}_g{self.games}_s{self.seed}"
+
+    @property
+    def record_size(self) -> int:
+        """Размер одного поля в файле корпуса в байтах"""
+        return FIRST_CLICK.size + (self.rows * self.cols + 7) // 8
+
+    def get_chunk(self, start: int, stop: int) -> "BoardCorpus":
+        """
+        Возвращает корпус с частью полей, чтобы не передавать воркеру весь корпус.
+
+        :param start: индекс первого поля
+        :param stop: индекс поля, перед которым остановиться
+        :return: корпус с теми же параметрами и частью полей
+        """
+        chunk = BoardCorpus(self.rows, self.cols, self.bugs, self.games, self.seed)
+        chunk.boards = self.boards[start:stop]
+        return chunk
+
+    def load(self, cache_dir: Path = CORPUS_CACHE_DIR) -> "BoardCorpus":
+        """
+        Загружает корпус из кэша, а если его там нет или файл поврежден, то генерирует и сохраняет в кэш.
+
+        :param cache_dir: папка кэша
+        :return: корпус
+        """
+        path = cache_dir / f"corpus_{self.cache_key}.bin"
+        if path.exists():
+            boards = self.read(path)
+            if boards is not None:
+                self.boards = boards
+                return self
+
+        self.boards = self.generate()
+        self.write(path, self.boards)
+        return self
+
+    def read(self, path: Path) -> list[CorpusBoard] | None:
+        """
+        Читает поля из файла кэша.
+
+        :param path: путь к файлу кэша
+        :return: список полей или None, если файл поврежден
+        """
+        try:
+            data = zlib.decompress(path.read_bytes())
+        except (OSError, zlib.error):
+            return None
+
+        # Файл неполный, если в нем не ровно столько полей, сколько должно быть в корпусе
+        if len(data) != self.games * self.record_size:
+            return None
+
+        return self.unpack(data)
+
+    def write(self, path: Path, boards: list[CorpusBoard]) -> None:
+        """
+        Записывает поля в файл кэша через временный файл, чтобы прерванный или параллельный запуск
+        не оставил в кэше неполный файл.
+
+        :param path: путь к файлу кэша
+        :param boards: список полей
+        :return: None
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False) as file:
+            file.write(zlib.compress(self.pack(boards)))
+        try:
+            os.replace(file.name, path)
+        except OSError:
+            os.unlink(file.name)
+            raise
+
+    def generate(self) -> list[CorpusBoard]:
+        """
+        Генерирует поля той же логикой place_bugs, что и в игре.
+        Первый клик случайный, у каждого поля свое зерно.
+
+        :return: список полей
+        """
+        boards = []
+        for index in range(self.games):
+            rng = Random(f"{self.seed}:{index}")
+            first_click = (rng.randrange(self.rows), rng.randrange(self.cols))
+
+            game = DebuggerGame(self.rows, self.cols, self.bugs, rng=rng)
+            game.place_bugs(*first_click)
+
+            bugs = frozenset(
+                (row, col) for row in range(self.rows) for col in range(self.cols) if game.board[row][col].is_bug
+            )
+            boards.append(CorpusBoard(first_click=first_click, bugs=bugs))
+        return boards
+
+    def pack(self, boards: list[CorpusBoard]) -> bytes:
+        """
+        Упаковывает поля в байты: первый клик и битовая маска багов на каждое поле.
+
+        :param boards: список полей
+        :return: байты корпуса
+        """
+        mask_size = (self.rows * self.cols + 7) // 8
+        data = bytearray()
+        for board in boards:
+            mask = 0
+            for row, col in board.bugs:
+                mask |= 1 << (row * self.cols + col)
+            data += FIRST_CLICK.pack(*board.first_click)
+            data += mask.to_bytes(mask_size, "little")
+        return bytes(data)
+
+    def unpack(self, data: bytes) -> list[CorpusBoard]:
+        """
+        Распаковывает поля из байтов.
+
+        :param data: байты корпуса
+        :return: список полей
+        """
+        boards = []
+        for offset in range(0, len(data), self.record_size):
+            first_click = FIRST_CLICK.unpack_from(data, offset)
+            mask = int.from_bytes(data[offset + FIRST_CLICK.size:offset + self.record_size], "little")
+            bugs = frozenset(
+                divmod(index, self.cols) for index in range(self.rows * self.cols) if mask >> index & 1
+            )
+            boards.append(CorpusBoard(first_click=first_click, bugs=bugs))
+        return boards
+
+class BoardView(BoardSubscriber):
+    """
+    Класс поля, которое видит игрок.
+    Обновляется по событиям ядра игры и не раскрывает закрытые клетки.
+    """
+
+    def __init__(self, game: DebuggerGame) -> None:
+        """
+        :param game: ядро игры
+        :return: None
+        """
+        self.rows: int = game.rows
+        self.cols: int = game.cols
+        self.bugs: int = game.bugs
+        self.get_neighbors: Callable[[int, int], list[tuple[int, int]]] = game.get_neighbors
+        self.cells: list[list[int]] = [[HIDDEN] * game.cols for _ in range(game.rows)]
+
+    def on_cell_events(self, events: list[CellEvent]) -> bool:
+        """
+        Обновляет изменившиеся клетки поля игрока.
+
+        :param events: список событий изменения клеток
+        :return: истина = события приняты
+        """
+        for event in events:
+            if event.is_set_flag:
+                self.cells[event.row][event.col] = FLAG
+            elif event.is_revealed:
+                self.cells[event.row][event.col] = event.num_of_bugs_around
+            else:
+                self.cells[event.row][event.col] = HIDDEN
+        return True
+
+class Move:
+    """Класс хода стратегии"""
+
+    __slots__ = ("row", "col", "action_type", "is_guess")
+
+    def __init__(self, row: int, col: int, action_type: ActionType, is_guess: bool) -> None:
+        """
+        :param row: индекс строки клетки
+        :param col: индекс столбца клетки
+        :param action_type: тип действия (открыть клетку или отметить флагом)
+        :param is_guess: флаг истины означает, что ход сделан наугад
+        :return: None
+        """
+        self.row: int = row
+        self.col: int = col
+        self.action_type: ActionType = action_type
+        self.is_guess: bool = is_guess
+
+Strategy = Callable[[BoardView, Random], Move]
+
+# Зарегистрированные стратегии по имени. Воркеры находят стратегию по имени,
+# поэтому стратегия должна регистрироваться при импорте модуля
+STRATEGIES: dict[str, Strategy] = {}
+
+
+def register_strategy(name: str) -> Callable[[Strategy], Strategy]:
+    """
+    Декоратор регистрации стратегии для турнира.
+
+    :param name: имя стратегии в отчете
+    :return: декоратор
+    """
+    def decorator(strategy: Strategy) -> Strategy:
+        STRATEGIES[name] = strategy
+        return strategy
+
+    return decorator
+
+
+def get_random_move(view: BoardView, rng: Random) -> Move:
+    """
+    Возвращает ход наугад в любую закрытую клетку без флага.
+
+    :param view: поле игрока
+    :param rng: генератор случайных чисел
+    :return: ход
+    """
+    hidden_cells = [
+        (row, col) for row in range(view.rows) for col in range(view.cols) if view.cells[row][col] == HIDDEN
+    ]
+    row, col = rng.choice(hidden_cells)
+    return Move(row=row, col=col, action_type=ActionType.OPEN, is_guess=True)
+
+
+@register_strategy("random")
+def random_strategy(view: BoardView, rng: Random) -> Move:
+    """Открывает случайные клетки"""
+    return get_random_move(view, rng)
+
+
+@register_strategy("single_point")
+def single_point_strategy(view: BoardView, rng: Random) -> Move:
+    """
+    Ищет клетку с цифрой, для которой все баги вокруг уже отмечены (соседей можно открыть)
+    или все закрытые соседи являются багами (их можно отметить). Иначе открывает клетку наугад.
+    """
+    for row in range(view.rows):
+        for col in range(view.cols):
+            num_of_bugs_around = view.cells[row][col]
+            if num_of_bugs_around <= 0:
+                continue
+
+            hidden_neighbors = []
+            flags = 0
+            for neighbor_row, neighbor_col in view.get_neighbors(row, col):
+                if view.cells[neighbor_row][neighbor_col] == HIDDEN:
+                    hidden_neighbors.append((neighbor_row, neighbor_col))
+                elif view.cells[neighbor_row][neighbor_col] == FLAG:
+                    flags += 1
+
+            if not hidden_neighbors:
+                continue
+
+            neighbor_row, neighbor_col = hidden_neighbors[0]
+            if num_of_bugs_around == flags:
+                return Move(row=neighbor_row, col=neighbor_col, action_type=ActionType.OPEN, is_guess=False)
+            if num_of_bugs_around == flags + len(hidden_neighbors):
+                return Move(row=neighbor_row, col=neighbor_col, action_type=ActionType.MARK, is_guess=False)
+
+    return get_random_move(view, rng)
+
+
+class StrategyReport:
+    """Класс накопленных результатов стратегии"""
+
+    def __init__(self, name: str) -> None:
+        """
+        :param name: имя стратегии
+        :return: None
+        """
+        self.name: str = name
+        self.games: int = 0
+        self.wins: int = 0
+        self.guesses: int = 0
+        self.decisions: int = 0
+        self.decision_time: float = 0.0  # суммарное время принятия решений в секундах
+
+    def merge(self, other: "StrategyReport") -> None:
+        """
+        Добавляет результаты другой части турнира.
+
+        :param other: результаты части полей
+        :return: None
+        """
+        self.games += other.games
+        self.wins += other.wins
+        self.guesses += other.guesses
+        self.decisions += other.decisions
+        self.decision_time += other.decision_time
+
+    @property
+    def win_rate(self) -> float:
+        """Доля побед"""
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def guesses_per_game(self) -> float:
+        """Среднее кол-во ходов наугад за игру"""
+        return self.guesses / self.games if self.games else 0.0
+
+    @property
+    def decision_time_ms(self) -> float:
+        """Среднее время принятия одного решения в миллисекундах"""
+        return self.decision_time / self.decisions * 1000 if self.decisions else 0.0
+
+
+def play_board(
+        strategy: Strategy,
+        corpus: BoardCorpus,
+        board: CorpusBoard,
+        seed: int,
+        report: StrategyReport
+) -> None:
+    """
+    Играет одно поле корпуса стратегией и добавляет результат в отчет.
+
+    :param strategy: стратегия
+    :param corpus: корпус, к которому относится поле
+    :param board: поле
+    :param seed: зерно генератора для ходов наугад
+    :param report: отчет стратегии
+    :return: None
+    """
+    rng = Random(seed)
+
+    # Расставляем баги из корпуса вместо случайной расстановки при первом клике
+    game = DebuggerGame(corpus.rows, corpus.cols, corpus.bugs)
+    game.load_bugs(board.bugs)
+
+    view = BoardView(game)
+    game.events.subscribe(view)
+    game.play_game(*board.first_click, action_type=ActionType.OPEN)
+
+    # Ограничиваем кол-во ходов, чтобы стратегия не могла бесконечно переставлять флаги
+    max_moves = 3 * corpus.rows * corpus.cols
+    for _ in range(max_moves):
+        if game.is_gameover:
+            break
+
+        started_at = perf_counter()
+        move = strategy(view, rng)
+        report.decision_time += perf_counter() - started_at
+        report.decisions += 1
+        report.guesses += move.is_guess
+
+        game.play_game(move.row, move.col, move.action_type)
+
+    report.games += 1
+    report.wins += game.is_win
+
+
+def play_boards(name: str, corpus: BoardCorpus, start: int) -> StrategyReport:
+    """
+    Играет часть полей корпуса одной стратегией. Выполняется в процессе-воркере.
+
+    :param name: имя зарегистрированной стратегии
+    :param corpus: корпус с частью полей
+    :param start: индекс первого поля части в полном корпусе
+    :return: отчет по сыгранным полям
+    """
+    report = StrategyReport(name)
+    strategy = STRATEGIES[name]
+
+    # Ядро игры печатает результаты игр, в турнире это только мешает
+    with redirect_stdout(StringIO()):
+        for index, board in enumerate(corpus.boards, start=start):
+            play_board(strategy, corpus, board, seed=corpus.seed + index, report=report)
+
+    return report
+
+
+def run_tournament(
+        corpus: BoardCorpus,
+        names: list[str] | None = None,
+        workers: int | None = None,
+        chunk_size: int = 50
+) -> list[StrategyReport]:
+    """
+    Играет корпус всеми стратегиями параллельно в процессах-воркерах.
+
+    :param corpus: загруженный корпус полей
+    :param names: имена стратегий, None = все зарегистрированные
+    :param workers: кол-во процессов, None = по кол-ву процессоров
+    :param chunk_size: кол-во полей в одной задаче воркера
+    :return: список отчетов по стратегиям
+    """
+    names = names if names is not None else list(STRATEGIES)
+    reports = {name: StrategyReport(name) for name in names}
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(play_boards, name, corpus.get_chunk(start, start + chunk_size), start)
+            for name in names
+            for start in range(0, len(corpus.boards), chunk_size)
+        ]
+        for future in futures:
+            report = future.result()
+            reports[report.name].merge(report)
+
+    return list(reports.values())
+
+
+def print_reports(reports: list[StrategyReport]) -> None:
+    """
+    Выводит на экран таблицу результатов турнира.
+
+    :param reports: список отчетов по стратегиям
+    :return: None
+    """
+    print(f"{'strategy':<16}{'games':>8}{'win rate':>10}{'guesses/game':>14}{'decision ms':>13}")
+    for report in sorted(reports, key=lambda report: report.win_rate, reverse=True):
+        print(
+            f"{report.name:<16}{report.games:>8}{report.win_rate:>10.1%}"
+            f"{report.guesses_per_game:>14.2f}{report.decision_time_ms:>13.3f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tournament of Debugger game strategies on identical boards")
+    parser.add_argument("--rows", type=int, default=10)
+    parser.add_argument("--cols", type=int, default=10)
+    parser.add_argument("--bugs", type=int, default=10)
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--strategy", action="append", choices=sorted(STRATEGIES), dest="strategies")
+    args = parser.parse_args()
+
+    board_corpus = BoardCorpus(args.rows, args.cols, args.bugs, args.games, args.seed).load()
+    print_reports(run_tournament(board_corpus, names=args.strategies, workers=args.workers))